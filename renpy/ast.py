@@ -28,12 +28,8 @@
 
 from typing import Any, Callable, ClassVar, Literal, Never
 
-import time
-import hashlib
-import ast
 import re
 import sys
-import zlib
 
 import renpy
 
@@ -143,7 +139,13 @@ class PyCode(Object):
 
         # The source code.
         if self.mode != "eval":
-            self.source, self.col_offset = PyCode.dedent(source)
+            rv = PyCode._dedent_cache.get(source, None)
+
+            if rv is None:
+                rv = PyCode.dedent(source)
+                PyCode._dedent_cache[source] = rv
+
+            self.source, self.col_offset = rv
         else:
             self.source = source
             self.col_offset = 0
@@ -157,7 +159,11 @@ class PyCode(Object):
             renpy.game.script.all_pycode.append(self)
 
 
-    _leading_whitespace_re = re.compile('(^[ ]*)(?:[^ ])', re.MULTILINE)
+    _dedent_cache: ClassVar[dict[str, tuple[str, int]]] = { }
+    """
+    Caches the result of dedent, keyed by the source text. The same source
+    is often re-dedented on reloads, translations, and lint.
+    """
 
     @staticmethod
     def dedent(text: str):
@@ -168,40 +174,40 @@ class PyCode(Object):
         This returns the dedented text, and the amount of whitespace removed,
         """
 
-        # Look for the longest leading string of spaces and tabs common to
-        # all lines.
-        margin = None
-        indents = PyCode._leading_whitespace_re.findall(text)
-        for indent in indents:
-            if margin is None:
-                margin = indent
+        # Fast path - if no line starts with a space, there is no margin to
+        # strip, and the text can be returned as-is.
+        if (not text.startswith(' ')) and ('\n ' not in text):
+            return text, 0
 
-            # Current line more deeply indented than previous winner:
-            # no change (previous winner is still on top).
-            elif indent.startswith(margin):
-                pass
+        lines = text.split("\n")
 
-            # Current line consistent with and no deeper than previous winner:
-            # it's the new winner.
-            elif margin.startswith(indent):
-                margin = indent
+        # Find the shortest leading run of spaces common to all non-blank
+        # lines, tracking it by length only. (The lexer has already
+        # normalized tabs to spaces.)
+        margin = -1
 
-            # Find the largest common whitespace between current line and previous
-            # winner.
-            else:
-                for i, (x, y) in enumerate(zip(margin, indent)):
-                    if x != y:
-                        margin = margin[:i]
-                        break
+        for line in lines:
+            i = 0
+            n = len(line)
 
-        if margin:
-            text = re.sub(r'(?m)^' + margin, '', text)
+            while i < n and line[i] == ' ':
+                i += 1
 
-        if margin:
-            return text, len(margin)
-        else:
+            # Entirely blank lines do not participate in the margin.
+            if i == n:
+                continue
+
+            if (margin < 0) or (i < margin):
+                margin = i
+
+        if margin <= 0:
             return text, 0
 
+        for i, line in enumerate(lines):
+            lines[i] = line[margin:] if line else ""
+
+        return "\n".join(lines), margin
+
 
 DoesNotExtend = renpy.object.Sentinel("DoesNotExtend")
 
@@ -213,6 +219,7 @@ class Scry(object):
     """
 
     _next: 'Node | None' = None
+    _next_scry: 'Scry | None' = None
     interacts: bool = False
 
     say: bool = False
@@ -238,12 +245,21 @@ class Scry(object):
     def next(self) -> 'Scry | None':
         if self._next is None:
             return None
-        else:
+
+        # Scrying the next node is expensive, so do it at most once per
+        # Scry object.
+        rv = self._next_scry
+
+        if rv is None:
             try:
-                return self._next.scry()
+                rv = self._next.scry()
             except Exception:
                 return None
 
+            self._next_scry = rv
+
+        return rv
+
 
 type NodeName = "str | tuple[Any, ...] | None"
 type RollbackType = Literal["normal", "never", "force"]
@@ -279,6 +295,12 @@ class Node(Object):
     When the name is a three-argument tuple, stores the serial number.
     """
 
+    _name_hash: SignedInt
+    """
+    Caches the result of hash(self.name), or None if it hasn't been computed
+    since the name was last set.
+    """
+
     next: 'Node | None'
     """
     Node that unconditionally follows this one in the abstract syntax tree,
@@ -324,12 +346,17 @@ class Node(Object):
         * None, when the name is not known.
         """
 
-        if self._name:
-            return self._name
-        elif self.name_version:
-            return (self.filename, self.name_version, self.name_serial)
-        else:
-            return None
+        rv = self._name
+
+        if rv:
+            return rv
+
+        version = self.name_version
+
+        if version:
+            return (self.filename, version, self.name_serial)
+
+        return None
 
     @name.setter
     def name(self, value: NodeName):
@@ -342,10 +369,18 @@ class Node(Object):
             case _:
                 self._name = value
 
+        self._name_hash = None
+
     # An ast node is equal to its name, allowing it to be used as the key in renpy.script.Script.namemap.
 
     def __hash__(self):
-        return hash(self.name)
+        rv = self._name_hash
+
+        if rv is None:
+            rv = hash(self.name)
+            self._name_hash = rv
+
+        return rv
 
     def __eq__(self, other):
         return self.name == other
@@ -368,7 +403,7 @@ class Node(Object):
             logical line on which this Node node starts.
         """
 
-        self.filename = loc[0]
+        self.filename = sys.intern(loc[0])
         self.linenumber = loc[1]
 
         self.name = None
@@ -544,8 +579,11 @@ def statement_name(name: str):
     global current_statement_name
     current_statement_name = name
 
-    for i in renpy.config.statement_callbacks:
-        i(name)
+    callbacks = renpy.config.statement_callbacks
+
+    if callbacks:
+        for i in callbacks:
+            i(name)
 
 
 def next_node(n: Node | None):
@@ -558,6 +596,30 @@ def next_node(n: Node | None):
     renpy.game.context().next_node = n
 
 
+# The compiled matcher for a say statement's who expression. This is created
+# on first use, as renpy.lexer may not be loaded when this module is.
+match_say_who_word: Callable[[str], Any] | None = None
+
+
+def say_who_is_word(who: str) -> bool:
+    """
+    Returns true if `who` is a single word (per renpy.lexer.word_regexp,
+    possibly followed by whitespace), and so is simple enough to be looked
+    up directly rather than evaluated.
+    """
+
+    # Fast path - an ASCII identifier always matches word_regexp.
+    if who.isascii() and who.isidentifier():
+        return True
+
+    global match_say_who_word
+
+    if match_say_who_word is None:
+        match_say_who_word = re.compile(renpy.lexer.word_regexp + r"\s*$").match
+
+    return match_say_who_word(who) is not None
+
+
 def probably_side_effect_free(expr: str) -> bool:
     """
     Returns true if an expr probably does not have side effects, and should
@@ -565,7 +627,7 @@ def probably_side_effect_free(expr: str) -> bool:
     doesn't allow for a function call.
     """
 
-    return not ("(" in expr)
+    return "(" not in expr
 
 
 def chain_block(block: list[Node], next: Node | None) -> None:
@@ -578,8 +640,8 @@ def chain_block(block: list[Node], next: Node | None) -> None:
     if not block:
         return
 
-    for a, b in zip(block, block[1:]):
-        a.chain(b)
+    for i in range(len(block) - 1):
+        block[i].chain(block[i + 1])
 
     block[-1].chain(next)
 
@@ -611,13 +673,17 @@ def eval_who(who: str | None, fast: bool | None = None) -> Any | None:
     if who is None:
         return None
 
-    if 'store.character' in renpy.python.store_dicts:
-        rv = renpy.python.store_dicts['store.character'].get(who, None)
+    store_dicts = renpy.python.store_dicts
+
+    character_store = store_dicts.get('store.character', None)
+
+    if character_store is not None:
+        rv = character_store.get(who, None)
     else:
         rv = None
 
     if rv is None:
-        rv = renpy.python.store_dicts['store'].get(who, None)
+        rv = store_dicts['store'].get(who, None)
 
     if rv is not None:
         return rv
@@ -682,6 +748,23 @@ def predict_imspec(imspec: ImspecType, scene=False, atl: 'renpy.atl.RawBlock | N
     renpy.exports.predict_show(name, layer, what=img, tag=tag, at_list=at_list)
 
 
+def hide_imspec_target(imspec: ImspecType) -> tuple[tuple[str, ...], 'str | None', 'str | None']:
+    """
+    Returns the (name, tag, layer) parts of `imspec`, the only parts that
+    matter when hiding an image.
+    """
+
+    if len(imspec) == 7:
+        name, _expression, tag, _at_list, layer, _zorder, _behind = imspec
+    elif len(imspec) == 6:
+        name, _expression, tag, _at_list, layer, _zorder = imspec
+    else:
+        name, _at_list, layer = imspec
+        tag = None
+
+    return name, tag, layer
+
+
 def show_imspec(imspec: ImspecType, atl: 'renpy.atl.RawBlock | None' = None):
 
     if len(imspec) == 7:
@@ -743,19 +826,23 @@ def show_imspec(imspec: ImspecType, atl: 'renpy.atl.RawBlock | None' = None):
 
 
 def create_store(name: str):
-    if name in renpy.config.special_namespaces:
+    special_namespaces = renpy.config.special_namespaces
+
+    if name in special_namespaces:
         return
 
     # Take first two components of dot-joined name
-    maybe_special = ".".join(name.split(".")[:2])
-    if maybe_special in renpy.config.special_namespaces:
-        if not renpy.config.special_namespaces[maybe_special].allow_child_namespaces:
+    maybe_special = ".".join(name.split(".", 2)[:2])
+    if (maybe_special != name) and (maybe_special in special_namespaces):
+        if not special_namespaces[maybe_special].allow_child_namespaces:
             raise Exception('Creating stores within the {} namespace is not supported.'.format(maybe_special[6:]))
 
     renpy.python.create_store(name)
 
 
 class StoreNamespace:
+    __slots__ = ("store",)
+
     pure = True
     repeat_at_default_time = False
 
@@ -800,7 +887,7 @@ def _reach_any(source: Node, target: Node) -> bool:
 def get_reachable_nodes(
     entry_nodes: list[Node],
     node_validator: Callable[[Node, Node], bool] = _reach_any,
-    seen: set[Node] | None = None
+    seen: set[int] | None = None
 ) -> list[Node]:
     """
     Starting with `entry_nodes`, tries to reach new nodes by calling
@@ -816,7 +903,7 @@ def get_reachable_nodes(
         By default allow any pairs of nodes.
 
     `seen`
-        If not None, a set of nodes that have already been seen.
+        If not None, a set of the ids of nodes that have already been seen.
         This can be used to avoid redundant work for multiple calls to this
         function.
 
@@ -829,24 +916,29 @@ def get_reachable_nodes(
     arguments.
     """
 
-    from collections import deque
-
     result = []
-    worklist = deque(entry_nodes)
+
+    # The worklist is a list used as a queue - index is the position of the
+    # next node to process. This keeps the breadth-first order a deque would
+    # give, without the import or the popleft calls.
+    worklist = list(entry_nodes)
+    index = 0
 
     if seen is None:
         seen = set()
 
-    while worklist:
-        node = worklist.popleft()
-        if node in seen:
+    while index < len(worklist):
+        node = worklist[index]
+        index += 1
+
+        if id(node) in seen:
             continue
 
-        seen.add(node)
+        seen.add(id(node))
         result.append(node)
 
         for n in node.get_reachable():
-            if n in seen:
+            if id(n) in seen:
                 continue
 
             if not node_validator(node, n):
@@ -895,7 +987,7 @@ class Say(Node):
 
         if who is not None:
             # True if who is a simple enough expression we can just look it up.
-            if re.match(renpy.lexer.word_regexp + r"\s*$", who):
+            if say_who_is_word(who):
                 self.who_fast = True
                 self.who = sys.intern(who.strip())
             else:
@@ -945,9 +1037,11 @@ class Say(Node):
         if not self.interact:
             rv.append("nointeract")
 
-        if getattr(self, "identifier", None) and self.explicit_identifier:
+        identifier = self.identifier
+
+        if identifier and self.explicit_identifier:
             rv.append("id")
-            rv.append(getattr(self, "identifier", None))
+            rv.append(identifier)
 
         if self.arguments:
             rv.append(self.arguments.get_code())
@@ -963,10 +1057,12 @@ class Say(Node):
 
         next_node(self.next)
 
+        ctx = renpy.game.context()
+
         try:
 
-            renpy.game.context().say_attributes = self.attributes
-            renpy.game.context().temporary_attributes = self.temporary_attributes
+            ctx.say_attributes = self.attributes
+            ctx.temporary_attributes = self.temporary_attributes
 
             who = eval_who(self.who, self.who_fast)
 
@@ -1010,19 +1106,21 @@ class Say(Node):
             renpy.exports.say(who, what, *args, **kwargs)
 
         finally:
-            renpy.game.context().say_attributes = None
-            renpy.game.context().temporary_attributes = None
+            ctx.say_attributes = None
+            ctx.temporary_attributes = None
             renpy.store._last_raw_what = ""
 
     def predict(self):
 
-        old_attributes = renpy.game.context().say_attributes
-        old_temporary_attributes = renpy.game.context().temporary_attributes
+        ctx = renpy.game.context()
+
+        old_attributes = ctx.say_attributes
+        old_temporary_attributes = ctx.temporary_attributes
 
         try:
 
-            renpy.game.context().say_attributes = self.attributes
-            renpy.game.context().temporary_attributes = self.temporary_attributes
+            ctx.say_attributes = self.attributes
+            ctx.temporary_attributes = self.temporary_attributes
 
             who = eval_who(self.who, self.who_fast)
 
@@ -1041,8 +1139,8 @@ class Say(Node):
             renpy.exports.predict_say(who, what)
 
         finally:
-            renpy.game.context().say_attributes = old_attributes
-            renpy.game.context().temporary_attributes = old_temporary_attributes
+            ctx.say_attributes = old_attributes
+            ctx.temporary_attributes = old_temporary_attributes
 
         return [self.next]
 
@@ -1053,10 +1151,11 @@ class Say(Node):
         rv.who = who
         rv.say = True
 
-        try:
-            rv.multiple = self.arguments.evaluate()[1]["multiple"]
-        except Exception:
-            pass
+        if self.arguments is not None:
+            try:
+                rv.multiple = self.arguments.evaluate()[1]["multiple"]
+            except Exception:
+                pass
 
         if self.interact:
             renpy.exports.scry_say(who, self.what, rv)
@@ -1159,22 +1258,32 @@ class Label(Node):
 
         renpy.game.context().mark_seen()
 
-        values = apply_arguments(
-            self.parameters,
-            renpy.store._args,
-            renpy.store._kwargs)
+        parameters = self.parameters
+        args = renpy.store._args
+        kwargs = renpy.store._kwargs
+
+        # The common case - a plain label called without arguments - has
+        # nothing to apply and nothing to make dynamic.
+        if (parameters is None) and (args is None) and (kwargs is None):
+            values = None
+        else:
+            values = apply_arguments(parameters, args, kwargs)
 
-        renpy.exports.dynamic(**values)
+        if values:
+            renpy.exports.dynamic(**values)
 
         renpy.store._args = None
         renpy.store._kwargs = None
 
-        renpy.easy.run_callbacks(
-            renpy.config.label_callback, self.name,
-            renpy.game.context().last_abnormal)
-        renpy.easy.run_callbacks(
-            renpy.config.label_callbacks, self.name,
-            renpy.game.context().last_abnormal)
+        label_callback = renpy.config.label_callback
+        label_callbacks = renpy.config.label_callbacks
+
+        if (label_callback is not None) or label_callbacks:
+            name = self.name
+            last_abnormal = renpy.game.context().last_abnormal
+
+            renpy.easy.run_callbacks(label_callback, name, last_abnormal)
+            renpy.easy.run_callbacks(label_callbacks, name, last_abnormal)
 
     def restructure(self, callback):
         callback(self.block)
@@ -1304,8 +1413,8 @@ class Image(Node):
 
     def execute(self):
 
-        # Note: We should always check that self.code is None before
-        # accessing self.atl, as self.atl may not always exist.
+        # Note: self.code takes precedence over self.atl, and is checked
+        # first. (Slots guarantee both attributes exist, defaulting to None.)
 
         next_node(self.next)
         statement_name("image")
@@ -1318,7 +1427,7 @@ class Image(Node):
         renpy.exports.image(self.imgname, img)
 
     def analyze(self):
-        if getattr(self, 'atl', None) is not None:
+        if self.atl is not None:
             # ATL images must participate with the game defined
             # constant names. So, we pass empty parameters to enable it.
             self.atl.analyze(EMPTY_PARAMETERS)
@@ -1353,7 +1462,7 @@ class Transform(Node):
         next_node(self.next)
         statement_name("transform")
 
-        parameters = getattr(self, "parameters", None)
+        parameters = self.parameters
 
         if parameters is None:
             parameters = Transform.default_parameters
@@ -1367,7 +1476,7 @@ class Transform(Node):
 
     def analyze(self):
 
-        parameters = getattr(self, "parameters", None)
+        parameters = self.parameters
 
         if parameters is None:
             parameters = Transform.default_parameters
@@ -1400,14 +1509,14 @@ class Show(Node):
         next_node(self.next)
         statement_name("show")
 
-        show_imspec(self.imspec, atl=getattr(self, "atl", None))
+        show_imspec(self.imspec, atl=self.atl)
 
     def predict(self):
-        predict_imspec(self.imspec, atl=getattr(self, "atl", None))
+        predict_imspec(self.imspec, atl=self.atl)
         return [self.next]
 
     def analyze(self):
-        if getattr(self, 'atl', None) is not None:
+        if self.atl is not None:
             # ATL block defined for show, scene or show layer statements
             # must participate with the game defined constant names.
             # So, we pass empty parameters to enable it.
@@ -1436,7 +1545,8 @@ class ShowLayer(Node):
         next_node(self.next)
         statement_name("show layer")
 
-        at_list = [renpy.python.py_eval(i) for i in self.at_list]
+        py_eval = renpy.python.py_eval
+        at_list = [py_eval(i) for i in self.at_list]
 
         if self.atl is not None:
             atl = renpy.display.motion.ATLTransform(self.atl)
@@ -1474,7 +1584,8 @@ class Camera(Node):
         next_node(self.next)
         statement_name("show layer")
 
-        at_list = [renpy.python.py_eval(i) for i in self.at_list]
+        py_eval = renpy.python.py_eval
+        at_list = [py_eval(i) for i in self.at_list]
 
         if self.atl is not None:
             atl = renpy.display.motion.ATLTransform(self.atl)
@@ -1528,17 +1639,17 @@ class Scene(Node):
         renpy.config.scene(self.layer)
 
         if self.imspec:
-            show_imspec(self.imspec, atl=getattr(self, "atl", None))
+            show_imspec(self.imspec, atl=self.atl)
 
     def predict(self):
 
         if self.imspec:
-            predict_imspec(self.imspec, atl=getattr(self, "atl", None), scene=True)
+            predict_imspec(self.imspec, atl=self.atl, scene=True)
 
         return [self.next]
 
     def analyze(self):
-        if getattr(self, 'atl', None) is not None:
+        if self.atl is not None:
             self.atl.analyze(EMPTY_PARAMETERS)
 
 
@@ -1564,18 +1675,7 @@ class Hide(Node):
 
     def predict(self):
 
-        if len(self.imspec) == 7:
-            name, _expression, tag, _at_list, layer, _zorder, _behind = self.imspec
-
-        elif len(self.imspec) == 6:
-            name, _expression, tag, _at_list, layer, _zorder = self.imspec
-            _behind = None
-        else:
-            name, _at_list, layer = self.imspec
-            tag = None
-            _expression = None
-            _zorder = None
-            _behind = None
+        name, tag, layer = hide_imspec_target(self.imspec)
 
         if tag is None:
             tag = name[0]
@@ -1591,15 +1691,7 @@ class Hide(Node):
         next_node(self.next)
         statement_name("hide")
 
-        if len(self.imspec) == 7:
-            name, _expression, tag, _at_list, layer, _zorder, _behind = self.imspec
-        elif len(self.imspec) == 6:
-            name, _expression, tag, _at_list, layer, _zorder = self.imspec
-        else:
-            name, _at_list, layer = self.imspec
-            _expression = None
-            tag = None
-            _zorder = 0
+        name, tag, layer = hide_imspec_target(self.imspec)
 
         layer = renpy.exports.default_layer(layer, tag or name)
 
@@ -1680,9 +1772,11 @@ class Call(Node):
             if isinstance(label, str) and label.startswith("."):
                 label = self.global_label + label
 
-        rv = renpy.game.context().call(label, return_site=self.next.name)
+        ctx = renpy.game.context()
+
+        rv = ctx.call(label, return_site=self.next.name)
         next_node(rv)
-        renpy.game.context().abnormal = True
+        ctx.abnormal = True
 
         if self.arguments:
             args, kwargs = self.arguments.evaluate()
@@ -1757,7 +1851,7 @@ class Return(Node):
 
         ctx = renpy.game.context()
 
-        if renpy.game.context().init_phase:
+        if ctx.init_phase:
             if len(ctx.return_stack) == 0:
 
                 if renpy.config.developer:
@@ -1765,8 +1859,8 @@ class Return(Node):
 
                 return
 
-        next_node(renpy.game.context().lookup_return(pop=True))
-        renpy.game.context().pop_dynamic()
+        next_node(ctx.lookup_return(pop=True))
+        ctx.pop_dynamic()
 
     def predict(self):
 
@@ -1852,15 +1946,21 @@ class Menu(Node):
         narration = []
         item_arguments = []
 
+        # Hoisted out of the loop - these don't change while the menu
+        # executes, and the filter is usually unset.
+        say_menu_text_filter = renpy.config.say_menu_text_filter
+        narrator_menu = renpy.config.narrator_menu
+        all_item_arguments = self.item_arguments
+
         for i, (label, condition, block) in enumerate(self.items):
 
-            if renpy.config.say_menu_text_filter:
-                label = renpy.config.say_menu_text_filter(label)
+            if say_menu_text_filter:
+                label = say_menu_text_filter(label)
 
             has_item = False
 
             if block is None:
-                if renpy.config.narrator_menu and label:
+                if narrator_menu and label:
                     narration.append(label)
                 else:
                     choices.append((label, condition, None))
@@ -1873,8 +1973,8 @@ class Menu(Node):
                 next_node(block[0])
 
             if has_item:
-                if self.item_arguments and (self.item_arguments[i] is not None):
-                    item_arguments.append(self.item_arguments[i].evaluate())
+                if all_item_arguments and (all_item_arguments[i] is not None):
+                    item_arguments.append(all_item_arguments[i].evaluate())
                 else:
                     item_arguments.append(((), {}))
 
@@ -1941,13 +2041,15 @@ class Menu(Node):
     def get_translation_strings(self):
         rv = super().get_translation_strings()
 
-        for (caption, _, block) in self.items:
-            if renpy.config.old_substitutions:
-                caption = caption.replace("%%", "%")
+        old_substitutions = renpy.config.old_substitutions
 
+        for (caption, _, block) in self.items:
             if caption is None:
                 continue
 
+            if old_substitutions:
+                caption = caption.replace("%%", "%")
+
             # Empty lines after the caption will strill make
             # this caption to be repoprted on wrong line,
             # but it is still better than line number of the menu itself
@@ -2062,6 +2164,13 @@ class While(Node):
     condition: str
     block: list[Node]
 
+    _condition_bytecode: Any
+    """
+    The compiled form of condition, created the first time this node
+    executes. (Nodes are written to .rpyc before they execute, so this
+    is always None at serialization time.)
+    """
+
     def __init__(self, loc, condition, block):
         super(While, self).__init__(loc)
 
@@ -2092,7 +2201,12 @@ class While(Node):
         next_node(self.next)
         statement_name("while")
 
-        if renpy.python.py_eval(self.condition):
+        bytecode = self._condition_bytecode
+
+        if bytecode is None:
+            bytecode = self._condition_bytecode = renpy.python.py_compile(self.condition, 'eval')
+
+        if renpy.python.py_eval_bytecode(bytecode):
             next_node(self.block[0])
 
     def predict(self):
@@ -2117,6 +2231,13 @@ class If(Node):
 
     entries: list[tuple[str, list[Node]]]
 
+    _condition_bytecodes: Any
+    """
+    The compiled forms of the entry conditions, created the first time this
+    node executes. (Nodes are written to .rpyc before they execute, so this
+    is always None at serialization time.)
+    """
+
     def __init__(self, loc, entries):
         """
         @param entries: A list of (condition, block) tuples.
@@ -2154,8 +2275,18 @@ class If(Node):
         next_node(self.next)
         statement_name("if")
 
-        for condition, block in self.entries:
-            if renpy.python.py_eval(condition):
+        bytecodes = self._condition_bytecodes
+
+        if bytecodes is None:
+            py_compile = renpy.python.py_compile
+            bytecodes = self._condition_bytecodes = [
+                py_compile(condition, 'eval') for condition, _block in self.entries
+            ]
+
+        py_eval_bytecode = renpy.python.py_eval_bytecode
+
+        for bytecode, (_condition, block) in zip(bytecodes, self.entries):
+            if py_eval_bytecode(bytecode):
                 next_node(block[0])
                 return
 
@@ -2200,6 +2331,19 @@ class UserStatement(Node):
     init_priority: SignedInt = 0
     atl: 'renpy.atl.RawBlock | None' = None
 
+    _reachable_cache: Any
+    """
+    Maps the is_reachable argument to the result of a reachable call, so
+    lint's repeated reachability queries don't re-dispatch into the
+    statement registry.
+    """
+
+    _statement_name: Any
+    """
+    Caches the name returned by get_name, which is fixed once the statement
+    has been parsed.
+    """
+
     def __init__(self, loc, line, block, parsed):
 
         super(UserStatement, self).__init__(loc)
@@ -2264,7 +2408,12 @@ class UserStatement(Node):
             parsed = renpy.statements.parse(self, self.line, self.block)
             self.parsed = parsed
 
-        return renpy.statements.call(method, parsed, *args, **kwargs)
+        handler = renpy.statements.registry[parsed[0]].get(method)
+
+        if handler is None:
+            return None
+
+        return handler(parsed[1], *args, **kwargs)
 
     def execute_init(self):
         self.call("execute_init")
@@ -2311,19 +2460,38 @@ class UserStatement(Node):
         next_list = self.call("predict_next", next_label)
 
         if next_list is not None:
-            nexts = [renpy.game.script.lookup_or_none(i) for i in next_list if i is not None]
-            return [i for i in nexts if i is not None]
+            lookup_or_none = renpy.game.script.lookup_or_none
+
+            rv = [ ]
+
+            for i in next_list:
+                if i is None:
+                    continue
+
+                node = lookup_or_none(i)
+
+                if node is not None:
+                    rv.append(node)
+
+            return rv
 
         return [self.next]
 
     def get_name(self):
-        parsed = self.parsed
 
-        if parsed is None:
-            parsed = renpy.statements.parse(self, self.line, self.block)
-            self.parsed = parsed
+        rv = self._statement_name
+
+        if rv is None:
+
+            parsed = self.parsed
 
-        return renpy.statements.get_name(parsed)
+            if parsed is None:
+                parsed = renpy.statements.parse(self, self.line, self.block)
+                self.parsed = parsed
+
+            rv = self._statement_name = renpy.statements.get_name(parsed)
+
+        return rv
 
     def get_next(self):
 
@@ -2359,6 +2527,15 @@ class UserStatement(Node):
         this statement.
         """
 
+        key = is_reachable
+
+        cache = self._reachable_cache
+
+        if cache is None:
+            cache = self._reachable_cache = { }
+        elif key in cache:
+            return cache[key]
+
         rv = self.call(
             "reachable",
             is_reachable,
@@ -2387,6 +2564,8 @@ class UserStatement(Node):
                 if self.next:
                     rv.add(self.next.name)
 
+        cache[key] = rv
+
         return rv
 
     def get_reachable(self) -> list[Node]:
@@ -2528,30 +2707,33 @@ class Define(Node):
         key = None
         new = None
 
+        operator = self.operator
+        index = self.index
+
         value = renpy.python.py_eval_bytecode(self.code.bytecode)
         ns, _special = get_namespace(self.store)
 
-        if (self.index is None) and (self.operator == "="):
+        if (index is None) and (operator == "="):
             ns.set(self.varname, value)
             return
 
         base = ns.get(self.varname)
         old = base
 
-        if self.index:
-            key = renpy.python.py_eval_bytecode(self.index.bytecode)
+        if index:
+            key = renpy.python.py_eval_bytecode(index.bytecode)
 
-            if self.operator != "=":
+            if operator != "=":
                 old = base[key]
 
-        if self.operator == "=":
+        if operator == "=":
             new = value
-        elif self.operator == "+=":
+        elif operator == "+=":
             new = old + value
-        elif self.operator == "|=":
+        elif operator == "|=":
             new = old | value
 
-        if self.index:
+        if index:
             base[key] = new
         else:
             ns.set(self.varname, new)
@@ -2735,9 +2917,11 @@ class Style(Node):
         if self.properties:
             properties = {}
 
+            py_eval = renpy.python.py_eval
+
             for name, expr in self.properties.items():
 
-                value = renpy.python.py_eval(expr)
+                value = py_eval(expr)
 
                 if name == "properties":
                     properties.update(value)
@@ -2827,6 +3011,11 @@ class Translate(Node):
     block: list[Node]
     after: Node | None
 
+    # A cache of the result of lookup, keyed on the language and translator
+    # serial it was computed for. (This never makes it into an .rpyc file, as
+    # those are written out before the game runs.)
+    _lookup_cache: Any
+
     def __init__(self, loc, identifier, language, block, alternate=None):
         super(Translate, self).__init__(loc)
 
@@ -2857,9 +3046,22 @@ class Translate(Node):
             self.after = new
 
     def lookup(self) -> Node:
-        return renpy.game.script.translator.lookup_translate(
+
+        translator = renpy.game.script.translator
+        key = (renpy.game.preferences.language, translator.serial)
+
+        cache = self._lookup_cache
+
+        if (cache is not None) and (cache[0] == key):
+            return cache[1]
+
+        rv = translator.lookup_translate(
             self.identifier,
-            getattr(self, "alternate", None))
+            self.alternate)
+
+        self._lookup_cache = (key, rv)
+
+        return rv
 
     def execute(self):
 
@@ -2869,8 +3071,9 @@ class Translate(Node):
 
         next_node(self.lookup())
 
-        renpy.game.context().translate_identifier = self.identifier
-        renpy.game.context().alternate_translate_identifier = getattr(self, "alternate", None)
+        ctx = renpy.game.context()
+        ctx.translate_identifier = self.identifier
+        ctx.alternate_translate_identifier = self.alternate
 
     def predict(self) -> list[Node | None]:
         return [self.lookup()]
@@ -2915,6 +3118,11 @@ class TranslateSay(Say):
     alternate: str | None
     language: str | None
 
+    # A cache of the result of lookup, keyed on the language and translator
+    # serial it was computed for. (This never makes it into an .rpyc file, as
+    # those are written out before the game runs.)
+    _lookup_cache: Any
+
     @property
     def after(self):
         return self.next
@@ -2959,16 +3167,30 @@ class TranslateSay(Say):
         Say.replace_next(self, old, new)
 
     def lookup(self) -> Node:
-        return renpy.game.script.translator.lookup_translate(
+
+        translator = renpy.game.script.translator
+        key = (renpy.game.preferences.language, translator.serial)
+
+        cache = self._lookup_cache
+
+        if (cache is not None) and (cache[0] == key):
+            return cache[1]
+
+        rv = translator.lookup_translate(
             self.identifier,
-            getattr(self, "alternate", None))
+            self.alternate)
+
+        self._lookup_cache = (key, rv)
+
+        return rv
 
     def execute(self):
 
         next_node(self.next)
 
-        renpy.game.context().translate_identifier = self.identifier
-        renpy.game.context().alternate_translate_identifier = getattr(self, "alternate", None)
+        ctx = renpy.game.context()
+        ctx.translate_identifier = self.identifier
+        ctx.alternate_translate_identifier = self.alternate
 
         if self.language is None:
 
@@ -2987,21 +3209,27 @@ class TranslateSay(Say):
 
         finally:
 
-            hashed_key = renpy.astsupport.hash64(self.identifier)
+            seen_translates = renpy.game.persistent._seen_translates
 
-            if (self.identifier not in renpy.game.persistent._seen_translates) and (hashed_key not in renpy.game.persistent._seen_translates):
+            # Only hash the identifier when it isn't already seen in
+            # unhashed form - hash64 walks the whole string.
+            if self.identifier not in seen_translates:
 
-                if renpy.config.hash_seen:
-                    renpy.game.persistent._seen_translates.add(hashed_key)
-                else:
-                    renpy.game.persistent._seen_translates.add(self.identifier)
+                hashed_key = renpy.astsupport.hash64(self.identifier)
+
+                if hashed_key not in seen_translates:
+
+                    if renpy.config.hash_seen:
+                        seen_translates.add(hashed_key)
+                    else:
+                        seen_translates.add(self.identifier)
 
-                renpy.game.seen_translates_count += 1
-                renpy.game.new_translates_count += 1
+                    renpy.game.seen_translates_count += 1
+                    renpy.game.new_translates_count += 1
 
             # Perform the equivalent of an endtranslate block.
-            renpy.game.context().translate_identifier = None
-            renpy.game.context().alternate_translate_identifier = None
+            ctx.translate_identifier = None
+            ctx.alternate_translate_identifier = None
 
     def predict(self) -> list[Node | None]:
         node = self.lookup()
@@ -3052,23 +3280,31 @@ class EndTranslate(Node):
     def execute(self):
         next_node(self.next)
 
-        tlid = renpy.game.context().translate_identifier
+        ctx = renpy.game.context()
+
+        tlid = ctx.translate_identifier
         if tlid is not None:
 
-            hashed_key = renpy.astsupport.hash64(tlid)
+            seen_translates = renpy.game.persistent._seen_translates
 
-            if (tlid not in renpy.game.persistent._seen_translates) and (hashed_key not in renpy.game.persistent._seen_translates):
+            # Only hash the identifier when it isn't already seen in
+            # unhashed form - hash64 walks the whole string.
+            if tlid not in seen_translates:
 
-                if renpy.config.hash_seen:
-                    renpy.game.persistent._seen_translates.add(hashed_key)
-                else:
-                    renpy.game.persistent._seen_translates.add(tlid)
+                hashed_key = renpy.astsupport.hash64(tlid)
+
+                if hashed_key not in seen_translates:
+
+                    if renpy.config.hash_seen:
+                        seen_translates.add(hashed_key)
+                    else:
+                        seen_translates.add(tlid)
 
-                renpy.game.seen_translates_count += 1
-                renpy.game.new_translates_count += 1
+                    renpy.game.seen_translates_count += 1
+                    renpy.game.new_translates_count += 1
 
-        renpy.game.context().translate_identifier = None
-        renpy.game.context().alternate_translate_identifier = None
+        ctx.translate_identifier = None
+        ctx.alternate_translate_identifier = None
 
 
 class TranslateString(Node):
@@ -56,8 +56,6 @@ Right now, it does the following things:
   to unicode strings before being written.
 """
 
-from __future__ import division, absolute_import, with_statement, print_function, unicode_literals
-
 import builtins
 
 import io
@@ -73,9 +71,7 @@ PY2 = False
 ################################################################################
 # Make open mimic Python 3.
 
-python_open = open
 open = builtins.open
-compat_open = open
 
 
 ################################################################################
@@ -83,8 +79,13 @@ compat_open = open
 
 import codecs
 
-strict_error = codecs.lookup_error("strict")
-codecs.register_error("python_strict", strict_error)
+# Skip registration when an earlier import of this module (in the same
+# process or an embedding one) has already performed it.
+try:
+    strict_error = codecs.lookup_error("python_strict")
+except LookupError:
+    strict_error = codecs.lookup_error("strict")
+    codecs.register_error("python_strict", strict_error)
 
 
 ################################################################################
@@ -98,17 +99,38 @@ str = builtins.str
 def bord(s): # type: (bytes) -> int
     return s[0]
 
+# All 256 single-byte strings, so bchr doesn't allocate a new one per call.
+bchr_table = tuple(bytes((i,)) for i in range(256))
+
 def bchr(i): # type: (int) -> bytes
+    if 0 <= i <= 255:
+        return bchr_table[i]
+
     return bytes([i])
 
+# The latin-1 encode function, looked up once so encoding doesn't have to
+# normalize the codec name on each call.
+latin1_encode = codecs.lookup("latin-1").encode
+
+# Exact-type dispatch for tobytes. Subclasses of str and bytes (like PyExpr)
+# miss this table and take the isinstance path below.
+tobytes_dispatch = {
+    bytes : lambda s: s,
+    str : lambda s: latin1_encode(s)[0],
+    }
+
 def tobytes(s):
+    f = tobytes_dispatch.get(type(s))
+
+    if f is not None:
+        return f(s)
+
     if isinstance(s, bytes):
         return s
+    elif isinstance(s, str):
+        return latin1_encode(s)[0]
     else:
-        if isinstance(s, str):
-            return s.encode('latin-1')
-        else:
-            return bytes(s)
+        return bytes(s)
 
 chr = builtins.chr
 
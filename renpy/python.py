@@ -1103,7 +1103,8 @@ def py_compile(source, mode, filename='<none>', lineno=1, ast_node=False, cache=
 
             return rv
 
-        bytecode = renpy.game.script.bytecode_oldcache.get(key, None)
+        script = renpy.game.script
+        bytecode = script.bytecode_oldcache.get(key, None)
 
         if bytecode is not None:
 
@@ -1111,10 +1112,10 @@ def py_compile(source, mode, filename='<none>', lineno=1, ast_node=False, cache=
                 rv = marshal.loads(bytecode)
                 py_compile_cache[key] = rv
 
-                renpy.game.script.bytecode_newcache[key] = bytecode
+                script.bytecode_newcache[key] = bytecode
 
-                if warnings_key in renpy.game.script.bytecode_oldcache:
-                    renpy.game.script.bytecode_newcache[warnings_key] = renpy.game.script.bytecode_oldcache[warnings_key]
+                if warnings_key in script.bytecode_oldcache:
+                    script.bytecode_newcache[warnings_key] = script.bytecode_oldcache[warnings_key]
 
                 return rv
 
@@ -390,8 +390,12 @@ def remove_from_ast(filename, linenumber):
 
     new_stmts = [ ]
 
+    # Membership is tested once per statement in the script, so use a set
+    # keyed on node identity rather than scanning the list each time.
+    node_ids = { id(i) for i in nodes }
+
     for i in renpy.game.script.all_stmts:
-        if i in nodes:
+        if id(i) in node_ids:
             continue
 
         i.replace_next(first, last.next)
@@ -402,11 +406,11 @@ def remove_from_ast(filename, linenumber):
 
     namemap = renpy.game.script.namemap
 
-    # This is fairly slow - when we remove a node, we have to replace it with
-    # the next node. But if we then remove the next node, we have to replace it
-    # again. So we just walk all the known names to do this.
+    # When we remove a node, we have to replace it with the next node. But if
+    # we then remove the next node, we have to replace it again. So we just
+    # walk all the known names to do this.
     for k in list(namemap):
-        if namemap[k] in nodes:
+        if id(namemap[k]) in node_ids:
             namemap[k] = last.next
 
     adjust_ast_linenumbers(filename, linenumber, -1)
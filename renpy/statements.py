@@ -24,7 +24,7 @@
 from __future__ import division, absolute_import, with_statement, print_function, unicode_literals
 from renpy.compat import PY2, basestring, bchr, bord, chr, open, pystr, range, round, str, tobytes, unicode # *
 
-
+import sys
 
 import renpy
 
@@ -379,6 +379,16 @@ def get(key, parsed):
     return registry[name].get(key, None)
 
 
+# Maps a statement's name tuple to its interned space-joined name.
+name_cache = { }
+
+
 def get_name(parsed):
     name, _parsed = parsed
-    return " ".join(name)
+
+    rv = name_cache.get(name, None)
+
+    if rv is None:
+        rv = name_cache[name] = sys.intern(" ".join(name))
+
+    return rv
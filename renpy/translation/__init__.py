@@ -104,6 +104,10 @@ class ScriptTranslator(object):
         # in that file.
         self.additional_strings = collections.defaultdict(list)
 
+        # Incremented whenever translates are added, to invalidate cached
+        # results of lookup_translate.
+        self.serial = 0
+
         # Scan for languages.
 
         for i in renpy.exports.list_files():
@@ -128,6 +132,8 @@ class ScriptTranslator(object):
         if not nodes:
             return
 
+        self.serial += 1
+
         from renpy.ast import (
             TranslatePython,
             TranslateBlock,